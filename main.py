@@ -3,13 +3,64 @@ Snowflake Infrastructure as Code with Pulumi
 Manages users, roles, databases, schemas, and tables
 """
 
+from __future__ import annotations
+
+import importlib
+import sys
+from collections.abc import Sequence
+from typing import TYPE_CHECKING, NamedTuple
+
 import pulumi
-import pulumi_snowflake as snowflake
-from typing import List, Dict, Optional
+
+
+class _LazyModule:
+    """
+    Stand-in for a module that is imported on first attribute access.
+
+    On first use the real module replaces this proxy in the module globals,
+    so later lookups go straight to the module.
+    """
+
+    __slots__ = ("_alias", "_module_name")
+
+    def __init__(self, alias: str, module_name: str):
+        self._alias = alias
+        self._module_name = module_name
+
+    def __getattr__(self, attr: str):
+        module = importlib.import_module(self._module_name)
+        globals()[self._alias] = module
+        return getattr(module, attr)
+
+
+# The provider SDK is large; defer loading it until a resource is created.
+# Type checkers see the real module so provider calls stay checked.
+if TYPE_CHECKING:
+    import pulumi_snowflake as snowflake
+else:
+    snowflake = _LazyModule("snowflake", "pulumi_snowflake")
+
+
+class _Cfg(NamedTuple):
+    """Stack configuration, resolved once at import."""
+
+    environment: str
+    default_comment: str
+    stack_spec: dict[str, list[dict]] | None
+
+
+def _load_config() -> _Cfg:
+    config = pulumi.Config()
+    environment = config.get("environment") or "dev"
+    return _Cfg(
+        environment=environment,
+        default_comment=sys.intern(f"Managed by Pulumi - {environment}"),
+        stack_spec=config.get_object("stack"),
+    )
+
 
 # Configuration
-config = pulumi.Config()
-environment = config.get("environment") or "dev"
+_CFG = _load_config()
 
 # ============================================================================
 # USERS
@@ -19,11 +70,12 @@ def create_user(
     name: str,
     login_name: str,
     email: str,
-    default_role: Optional[str] = None,
-    default_warehouse: Optional[str] = None,
-    default_namespace: Optional[str] = None,
+    default_role: str | None = None,
+    default_warehouse: str | None = None,
+    default_namespace: str | None = None,
     must_change_password: bool = True,
     disabled: bool = False,
+    opts: pulumi.ResourceOptions | None = None,
 ) -> snowflake.User:
     """
     Create a Snowflake user with standard configuration.
@@ -37,6 +89,7 @@ def create_user(
         default_namespace: Default database.schema
         must_change_password: Force password change on first login
         disabled: Whether the user is disabled
+        opts: Optional Pulumi resource options
     """
     return snowflake.User(
         name,
@@ -48,7 +101,8 @@ def create_user(
         default_namespace=default_namespace,
         must_change_password=must_change_password,
         disabled=disabled,
-        comment=f"Managed by Pulumi - {environment}",
+        comment=_CFG.default_comment,
+        opts=opts,
     )
 
 
@@ -56,12 +110,17 @@ def create_user(
 # ROLES
 # ============================================================================
 
-def create_role(name: str, comment: Optional[str] = None) -> snowflake.Role:
+def create_role(
+    name: str,
+    comment: str | None = None,
+    opts: pulumi.ResourceOptions | None = None,
+) -> snowflake.Role:
     """Create a Snowflake role."""
     return snowflake.Role(
         name,
         name=name,
-        comment=comment or f"Managed by Pulumi - {environment}",
+        comment=comment or _CFG.default_comment,
+        opts=opts,
     )
 
 
@@ -94,6 +153,7 @@ def create_warehouse(
     initially_suspended: bool = True,
     max_cluster_count: int = 1,
     min_cluster_count: int = 1,
+    opts: pulumi.ResourceOptions | None = None,
 ) -> snowflake.Warehouse:
     """
     Create a Snowflake warehouse with auto-scaling configuration.
@@ -106,6 +166,7 @@ def create_warehouse(
         initially_suspended: Start in suspended state
         max_cluster_count: Maximum clusters for auto-scaling
         min_cluster_count: Minimum clusters
+        opts: Optional Pulumi resource options
     """
     return snowflake.Warehouse(
         name,
@@ -116,7 +177,8 @@ def create_warehouse(
         initially_suspended=initially_suspended,
         max_cluster_count=max_cluster_count,
         min_cluster_count=min_cluster_count,
-        comment=f"Managed by Pulumi - {environment}",
+        comment=_CFG.default_comment,
+        opts=opts,
     )
 
 
@@ -126,8 +188,9 @@ def create_warehouse(
 
 def create_database(
     name: str,
-    comment: Optional[str] = None,
+    comment: str | None = None,
     data_retention_time_in_days: int = 1,
+    opts: pulumi.ResourceOptions | None = None,
 ) -> snowflake.Database:
     """
     Create a Snowflake database.
@@ -136,12 +199,14 @@ def create_database(
         name: Database name
         comment: Optional comment
         data_retention_time_in_days: Time travel retention period
+        opts: Optional Pulumi resource options
     """
     return snowflake.Database(
         name,
         name=name,
-        comment=comment or f"Managed by Pulumi - {environment}",
+        comment=comment or _CFG.default_comment,
         data_retention_time_in_days=data_retention_time_in_days,
+        opts=opts,
     )
 
 
@@ -153,9 +218,10 @@ def create_schema(
     name: str,
     database: pulumi.Input[str],
     schema_name: str,
-    comment: Optional[str] = None,
-    data_retention_days: Optional[int] = None,
+    comment: str | None = None,
+    data_retention_days: int | None = None,
     is_managed: bool = False,
+    opts: pulumi.ResourceOptions | None = None,
 ) -> snowflake.Schema:
     """
     Create a Snowflake schema.
@@ -167,14 +233,16 @@ def create_schema(
         comment: Optional comment
         data_retention_days: Override database retention setting
         is_managed: Whether this is a managed schema
+        opts: Optional Pulumi resource options
     """
     return snowflake.Schema(
         name,
         database=database,
         name=schema_name,
-        comment=comment or f"Managed by Pulumi - {environment}",
-        data_retention_days=data_retention_days,
-        is_managed=is_managed,
+        comment=comment or _CFG.default_comment,
+        data_retention_time_in_days=data_retention_days,
+        with_managed_access="true" if is_managed else "false",
+        opts=opts,
     )
 
 
@@ -182,14 +250,42 @@ def create_schema(
 # TABLES
 # ============================================================================
 
+class ColumnSpec(NamedTuple):
+    """A table column definition."""
+
+    name: str
+    type: str
+    nullable: bool = True
+
+
+def _column(col: ColumnSpec | tuple | dict) -> dict:
+    """
+    Convert one column definition to the provider's column dict.
+
+    Plain dicts are accepted wherever TableColumnArgs is and skip its
+    per-column constructor. Dict 'nullable' flags may be a bool (stack
+    config) or "true"/"false".
+    """
+    if isinstance(col, dict):
+        nullable = col.get("nullable", True)
+        if not isinstance(nullable, bool):
+            nullable = nullable == "true"
+        return {"name": col["name"], "type": col["type"], "nullable": nullable}
+    if not isinstance(col, ColumnSpec):
+        col = ColumnSpec(*col)
+    col_name, col_type, nullable = col
+    return {"name": col_name, "type": col_type, "nullable": nullable}
+
+
 def create_table(
     name: str,
     database: pulumi.Input[str],
     schema: pulumi.Input[str],
     table_name: str,
-    columns: List[Dict[str, str]],
-    comment: Optional[str] = None,
-    cluster_by: Optional[List[str]] = None,
+    columns: list[ColumnSpec | tuple | dict],
+    comment: str | None = None,
+    cluster_by: list[str] | None = None,
+    opts: pulumi.ResourceOptions | None = None,
 ) -> snowflake.Table:
     """
     Create a Snowflake table.
@@ -199,25 +295,14 @@ def create_table(
         database: Database name
         schema: Schema name
         table_name: Table name
-        columns: List of column definitions with 'name', 'type', and optional 'nullable'
+        columns: List of ColumnSpec (or plain (name, type, nullable) tuples);
+            dicts with 'name', 'type', and optional 'nullable' (bool or
+            "true"/"false") are also accepted
         comment: Optional comment
         cluster_by: Optional clustering keys
-    
-    Example columns:
-        [
-            {"name": "ID", "type": "NUMBER(38,0)", "nullable": "false"},
-            {"name": "NAME", "type": "VARCHAR(100)", "nullable": "true"},
-            {"name": "CREATED_AT", "type": "TIMESTAMP_NTZ", "nullable": "false"},
-        ]
+        opts: Optional Pulumi resource options
     """
-    column_specs = [
-        snowflake.TableColumnArgs(
-            name=col["name"],
-            type=col["type"],
-            nullable=col.get("nullable", "true") == "true",
-        )
-        for col in columns
-    ]
+    column_specs = [_column(col) for col in columns]
     
     return snowflake.Table(
         name,
@@ -225,8 +310,9 @@ def create_table(
         schema=schema,
         name=table_name,
         columns=column_specs,
-        comment=comment or f"Managed by Pulumi - {environment}",
-        cluster_bys=cluster_by,
+        comment=comment or _CFG.default_comment,
+        cluster_bies=cluster_by,
+        opts=opts,
     )
 
 
@@ -234,21 +320,174 @@ def create_table(
 # GRANTS
 # ============================================================================
 
+def _qualify(
+    database_name: pulumi.Input[str],
+    schema_name: pulumi.Input[str],
+) -> pulumi.Input[str]:
+    """Return 'DATABASE.SCHEMA', as a plain string when both parts are literals."""
+    if isinstance(database_name, str) and isinstance(schema_name, str):
+        return f"{database_name}.{schema_name}"
+    return _fqn(database_name, schema_name)
+
+
+# Qualified schema Outputs keyed by the ids of their inputs. Entries keep the
+# inputs alive so the ids stay unique, and live as long as the module: one
+# Pulumi program run, or every run in a process that reuses this module.
+_FQN_CACHE: dict[
+    tuple[int, int],
+    tuple[pulumi.Input[str], pulumi.Input[str], pulumi.Output[str]],
+] = {}
+
+
+def _fqn(
+    database_name: pulumi.Input[str],
+    schema_name: pulumi.Input[str],
+) -> pulumi.Output[str]:
+    """Concatenate 'DATABASE.SCHEMA', reusing one Output per pair of inputs."""
+    key = (id(database_name), id(schema_name))
+    entry = _FQN_CACHE.get(key)
+    if entry is None:
+        output = pulumi.Output.concat(database_name, ".", schema_name)
+        entry = _FQN_CACHE[key] = (database_name, schema_name, output)
+    return entry[2]
+
+
+# Shared privilege lists; the Pulumi runtime serializes any sequence
+_PRIV_USAGE = ("USAGE",)
+_PRIV_SELECT = ("SELECT",)
+
+# Object types granted through on_schema_object with an "all" target
+_SCHEMA_OBJECT_PLURALS = frozenset({
+    "TABLES",
+    "VIEWS",
+    "MATERIALIZED VIEWS",
+    "EXTERNAL TABLES",
+    "DYNAMIC TABLES",
+    "SEQUENCES",
+    "FUNCTIONS",
+    "PROCEDURES",
+    "STAGES",
+    "FILE FORMATS",
+    "STREAMS",
+    "TASKS",
+})
+
+
+# Object types granted through on_account_object
+_ACCOUNT_OBJECT_TYPES = frozenset({
+    "USER",
+    "RESOURCE MONITOR",
+    "WAREHOUSE",
+    "COMPUTE POOL",
+    "DATABASE",
+    "INTEGRATION",
+    "FAILOVER GROUP",
+    "REPLICATION GROUP",
+    "EXTERNAL VOLUME",
+})
+
+
+def _grant(
+    name: str,
+    role: pulumi.Input[str],
+    privileges: Sequence[str],
+    object_type: str,
+    object_name: pulumi.Input[str],
+) -> snowflake.GrantPrivilegesToAccountRole:
+    """
+    Grant privileges on a single object to a role.
+
+    Args:
+        name: Pulumi resource name
+        role: Role receiving the privileges
+        privileges: Privileges to grant
+        object_type: 'SCHEMA', a plural schema object type such as 'TABLES'
+            (granted on all objects in the schema), or an account object
+            type such as 'DATABASE' or 'WAREHOUSE'; anything else raises
+            ValueError
+        object_name: Object name; 'DATABASE.SCHEMA' for schema-level types
+    """
+    if object_type == "SCHEMA":
+        return snowflake.GrantPrivilegesToAccountRole(
+            name,
+            account_role_name=role,
+            privileges=privileges,
+            on_schema=snowflake.GrantPrivilegesToAccountRoleOnSchemaArgs(
+                schema_name=object_name,
+            ),
+        )
+    if object_type in _SCHEMA_OBJECT_PLURALS:
+        return snowflake.GrantPrivilegesToAccountRole(
+            name,
+            account_role_name=role,
+            privileges=privileges,
+            on_schema_object=snowflake.GrantPrivilegesToAccountRoleOnSchemaObjectArgs(
+                all=snowflake.GrantPrivilegesToAccountRoleOnSchemaObjectAllArgs(
+                    object_type_plural=object_type,
+                    in_schema=object_name,
+                ),
+            ),
+        )
+    if object_type in _ACCOUNT_OBJECT_TYPES:
+        return snowflake.GrantPrivilegesToAccountRole(
+            name,
+            account_role_name=role,
+            privileges=privileges,
+            on_account_object=snowflake.GrantPrivilegesToAccountRoleOnAccountObjectArgs(
+                object_type=object_type,
+                object_name=object_name,
+            ),
+        )
+    raise ValueError(f"unsupported grant object type: {object_type!r}")
+
+
+def grant_bulk_to_role(
+    name: str,
+    role: pulumi.Input[str],
+    privileges_by_object: dict[tuple, list[str]],
+) -> list[snowflake.GrantPrivilegesToAccountRole]:
+    """
+    Grant privileges on several objects to a role.
+
+    All privileges on the same object are merged into one grant resource,
+    instead of one resource per privilege. Each resource is named
+    '<name>-<object type>-<label>' from its key, so adding or removing
+    entries never renames the others.
+
+    Args:
+        name: Pulumi resource name prefix
+        role: Role receiving the privileges
+        privileges_by_object: Mapping of (object_type, object_name) or
+            (object_type, object_name, label) to the privileges to grant on
+            that object (see _grant for object types). The label defaults to
+            object_name and is required when object_name is not a string.
+    """
+    grants = []
+    for key, privileges in privileges_by_object.items():
+        if len(key) == 2:
+            object_type, object_name = key
+            label = object_name
+        elif len(key) == 3:
+            object_type, object_name, label = key
+        else:
+            raise ValueError(f"grant key must have 2 or 3 elements, got {key!r}")
+        if not isinstance(label, str):
+            raise ValueError(
+                f"grant on {object_type} needs a label when the object name "
+                "is not a string"
+            )
+        resource_name = f"{name}-{object_type.lower().replace(' ', '-')}-{label}"
+        grants.append(_grant(resource_name, role, privileges, object_type, object_name))
+    return grants
+
+
 def grant_database_usage(
     name: str,
     database_name: pulumi.Input[str],
     role: pulumi.Input[str],
 ) -> snowflake.GrantPrivilegesToAccountRole:
     """Grant USAGE privilege on database to a role."""
-    return snowflake.GrantPrivilegesToAccountRole(
-        name,
-        account_role_name=role,
-        privileges=["USAGE"],
-        on_account_object=snowflake.GrantPrivilegesToAccountRoleOnAccountObjectArgs(
-            object_type="DATABASE",
-            object_name=database_name,
-        ),
-    )
+    return _grant(name, role, _PRIV_USAGE, "DATABASE", database_name)
 
 
 def grant_schema_usage(
@@ -258,13 +497,12 @@ def grant_schema_usage(
     role: pulumi.Input[str],
 ) -> snowflake.GrantPrivilegesToAccountRole:
     """Grant USAGE privilege on schema to a role."""
-    return snowflake.GrantPrivilegesToAccountRole(
+    return _grant(
         name,
-        account_role_name=role,
-        privileges=["USAGE"],
-        on_schema=snowflake.GrantPrivilegesToAccountRoleOnSchemaArgs(
-            schema_name=pulumi.Output.concat(database_name, ".", schema_name),
-        ),
+        role,
+        _PRIV_USAGE,
+        "SCHEMA",
+        _qualify(database_name, schema_name),
     )
 
 
@@ -277,16 +515,12 @@ def grant_table_select(
 ) -> snowflake.GrantPrivilegesToAccountRole:
     """Grant SELECT privilege on tables to a role."""
     if all_tables:
-        return snowflake.GrantPrivilegesToAccountRole(
+        return _grant(
             name,
-            account_role_name=role,
-            privileges=["SELECT"],
-            on_schema_object=snowflake.GrantPrivilegesToAccountRoleOnSchemaObjectArgs(
-                all=snowflake.GrantPrivilegesToAccountRoleOnSchemaObjectAllArgs(
-                    object_type_plural="TABLES",
-                    in_schema=pulumi.Output.concat(database_name, ".", schema_name),
-                ),
-            ),
+            role,
+            _PRIV_SELECT,
+            "TABLES",
+            _qualify(database_name, schema_name),
         )
 
 
@@ -296,23 +530,117 @@ def grant_warehouse_usage(
     role: pulumi.Input[str],
 ) -> snowflake.GrantPrivilegesToAccountRole:
     """Grant USAGE privilege on warehouse to a role."""
-    return snowflake.GrantPrivilegesToAccountRole(
-        name,
-        account_role_name=role,
-        privileges=["USAGE"],
-        on_account_object=snowflake.GrantPrivilegesToAccountRoleOnAccountObjectArgs(
-            object_type="WAREHOUSE",
-            object_name=warehouse_name,
-        ),
-    )
+    return _grant(name, role, _PRIV_USAGE, "WAREHOUSE", warehouse_name)
+
+
+# ============================================================================
+# STACK COMPONENT
+# ============================================================================
+
+# Resource kinds accepted in a SnowflakeStack spec
+_STACK_KINDS = frozenset({
+    "users",
+    "roles",
+    "warehouses",
+    "databases",
+    "schemas",
+    "tables",
+})
+
+
+def _resolve(resources: dict, ref: pulumi.Input[str]) -> pulumi.Input[str]:
+    """Return the name Output of resources[ref], or ref itself if it is not a key."""
+    resource = resources.get(ref) if isinstance(ref, str) else None
+    return ref if resource is None else resource.name
+
+
+class SnowflakeStack(pulumi.ComponentResource):
+    """
+    Build a set of Snowflake resources from a declarative spec.
+
+    Every resource is created as a child of this component, so the whole
+    stack is registered under a single parent.
+
+    Args:
+        name: Pulumi resource name
+        spec: Mapping of resource kind ('users', 'roles', 'warehouses',
+            'databases', 'schemas', 'tables') to a list of keyword
+            arguments for the matching create_* function. A schema's
+            'database' and a table's 'database'/'schema' may name a
+            database or schema in the same spec by its Pulumi resource name,
+            which links the child to that resource so it is created first.
+            Any other kind raises ValueError.
+        opts: Optional Pulumi resource options
+    """
+
+    def __init__(
+        self,
+        name: str,
+        spec: dict[str, list[dict]],
+        opts: pulumi.ResourceOptions | None = None,
+    ):
+        unknown = set(spec) - _STACK_KINDS
+        if unknown:
+            raise ValueError(f"unsupported stack spec kinds: {sorted(unknown)!r}")
+
+        super().__init__("snowflake:template:SnowflakeStack", name, None, opts)
+        child_opts = pulumi.ResourceOptions(parent=self)
+
+        self.users = {
+            args["name"]: create_user(**args, opts=child_opts)
+            for args in spec.get("users", [])
+        }
+        self.roles = {
+            args["name"]: create_role(**args, opts=child_opts)
+            for args in spec.get("roles", [])
+        }
+        self.warehouses = {
+            args["name"]: create_warehouse(**args, opts=child_opts)
+            for args in spec.get("warehouses", [])
+        }
+        self.databases = {
+            args["name"]: create_database(**args, opts=child_opts)
+            for args in spec.get("databases", [])
+        }
+        self.schemas = {
+            args["name"]: create_schema(
+                **{**args, "database": _resolve(self.databases, args["database"])},
+                opts=child_opts,
+            )
+            for args in spec.get("schemas", [])
+        }
+        self.tables = {
+            args["name"]: create_table(
+                **{
+                    **args,
+                    "database": _resolve(self.databases, args["database"]),
+                    "schema": _resolve(self.schemas, args["schema"]),
+                },
+                opts=child_opts,
+            )
+            for args in spec.get("tables", [])
+        }
+
+        names_by_kind = {
+            "users": {key: user.name for key, user in self.users.items()},
+            "roles": {key: role.name for key, role in self.roles.items()},
+            "warehouses": {key: wh.name for key, wh in self.warehouses.items()},
+            "databases": {key: db.name for key, db in self.databases.items()},
+            "schemas": {key: schema.name for key, schema in self.schemas.items()},
+            "tables": {key: table.name for key, table in self.tables.items()},
+        }
+        # Snowflake names per kind, keyed by Pulumi resource name
+        self.names = {kind: names for kind, names in names_by_kind.items() if names}
+        self.register_outputs(self.names)
+
 
 # ============================================================================
-# EXPORTS
+# STACK ENTRYPOINT
 # ============================================================================
 
-pulumi.export("warehouse", example_wh.name)
-pulumi.export("database", example_db.name)
-pulumi.export("schema", example_schema.name)
-pulumi.export("table", example_table.name)
-pulumi.export("user", example_user.name)
-pulumi.export("role", example_role.name)
+# Build the stack only when a spec is configured, so importing this module
+# for its helper functions never creates resources.
+if _CFG.stack_spec:
+    stack = SnowflakeStack(f"snowflake-{_CFG.environment}", _CFG.stack_spec)
+    for kind, names in stack.names.items():
+        pulumi.export(kind, names)
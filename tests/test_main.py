@@ -0,0 +1,118 @@
+"""Unit tests for main.py, run against Pulumi's resource mocks."""
+
+import os
+import sys
+
+import pulumi
+import pytest
+
+
+class SnowflakeMocks(pulumi.runtime.Mocks):
+    """Record resource inputs; databases report a distinct resolved name."""
+
+    def __init__(self):
+        self.inputs = {}
+
+    def new_resource(self, args):
+        self.inputs[args.name] = args.inputs
+        state = dict(args.inputs)
+        if args.typ == "snowflake:index/database:Database":
+            state["name"] = f"{args.inputs['name']}_RESOLVED"
+        return [f"{args.name}_id", state]
+
+    def call(self, args):
+        return {}
+
+
+mocks = SnowflakeMocks()
+pulumi.runtime.set_mocks(
+    mocks, project="snowflake-infrastructure", stack="test", preview=False
+)
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import main  # noqa: E402
+
+
+@pulumi.runtime.test
+def test_bulk_grant_names_come_from_keys():
+    db = main.create_database("bulk-db")
+    grants = main.grant_bulk_to_role(
+        "analyst",
+        "ANALYST",
+        {
+            ("DATABASE", db.name, "sales"): ["USAGE"],
+            ("SCHEMA", "SALES.TX"): ["USAGE"],
+            ("TABLES", "SALES.TX"): ["SELECT"],
+            ("RESOURCE MONITOR", "MONITOR"): ["MONITOR"],
+        },
+    )
+
+    def check(urns):
+        assert [urn.rsplit("::", 1)[1] for urn in urns] == [
+            "analyst-database-sales",
+            "analyst-schema-SALES.TX",
+            "analyst-tables-SALES.TX",
+            "analyst-resource-monitor-MONITOR",
+        ]
+
+    return pulumi.Output.all(*[grant.urn for grant in grants]).apply(check)
+
+
+def test_bulk_grant_requires_label_for_output_names():
+    db = main.create_database("unlabelled-db")
+    with pytest.raises(ValueError, match="needs a label"):
+        main.grant_bulk_to_role(
+            "analyst", "ANALYST", {("DATABASE", db.name): ["USAGE"]}
+        )
+
+
+def test_bulk_grant_rejects_malformed_keys():
+    with pytest.raises(ValueError, match="2 or 3 elements"):
+        main.grant_bulk_to_role(
+            "analyst", "ANALYST", {("DATABASE", "SALES", "sales", "extra"): ["USAGE"]}
+        )
+
+
+def test_grant_rejects_unknown_object_types():
+    with pytest.raises(ValueError, match="unsupported grant object type"):
+        main.grant_bulk_to_role(
+            "analyst", "ANALYST", {("TABLE", "SALES.TX.T"): ["SELECT"]}
+        )
+
+
+@pulumi.runtime.test
+def test_stack_links_schemas_and_tables_to_spec_resources():
+    stack = main.SnowflakeStack(
+        "linked",
+        {
+            "databases": [{"name": "sales-database"}],
+            "schemas": [
+                {
+                    "name": "tx-schema",
+                    "database": "sales-database",
+                    "schema_name": "TX",
+                },
+            ],
+            "tables": [
+                {
+                    "name": "orders-table",
+                    "database": "sales-database",
+                    "schema": "tx-schema",
+                    "table_name": "ORDERS",
+                    "columns": [main.ColumnSpec("ID", "NUMBER(38,0)", nullable=False)],
+                },
+            ],
+        },
+    )
+
+    def check(_):
+        assert mocks.inputs["tx-schema"]["database"] == "sales-database_RESOLVED"
+        assert mocks.inputs["orders-table"]["database"] == "sales-database_RESOLVED"
+        assert mocks.inputs["orders-table"]["schema"] == "TX"
+
+    return stack.tables["orders-table"].id.apply(check)
+
+
+def test_stack_rejects_unknown_kinds():
+    with pytest.raises(ValueError, match="unsupported stack spec kinds"):
+        main.SnowflakeStack("typo", {"warehouse": [{"name": "wh"}]})